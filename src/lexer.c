@@ -17,6 +17,11 @@ typedef struct _tag_lexer_ {
 	size_t cur;
 } Lexer;
 
+/* per-char class table: non-zero means the char is a token separator */
+static const unsigned char SEPARATOR[256] = {
+	[' '] = 1, ['\t'] = 1, ['\n'] = 1, ['\r'] = 1,
+};
+
 static int open_lexer(Lexer *lexer, const char *filepath) {
 	int ret = -1;
 
@@ -40,6 +45,12 @@ static int open_lexer(Lexer *lexer, const char *filepath) {
 		goto END;
 	}
 
+	// hint the kernel we scan the source front-to-back for read-ahead
+	int rc = posix_madvise(lexer->ptr, lexer->size, POSIX_MADV_SEQUENTIAL);
+	if (0 != rc) {
+		_D(INFO, "cannot advise sequential access: %s", strerror(rc));
+	}
+
 	_D(INFO, "load %s into memory with size %zu", filepath, lexer->size);
 	ret = 0;
 END:
@@ -53,31 +64,31 @@ static void close_lexer(Lexer *lexer) {
 }
 
 static int next_token(Lexer *lexer, char *token, size_t token_len) {
-	int len = 0;
+	size_t start, len;
+
+	// collapse the whole run of leading separators in one scan
+	while (lexer->cur < lexer->size && SEPARATOR[(unsigned char)lexer->ptr[lexer->cur]]) {
+		lexer->cur ++;
+	}
 
 	if (lexer->cur >= lexer->size) {
 		_D(INFO, "end-of-file");
 		return -1;
 	}
 
-	for (; lexer->cur < lexer->size; ++lexer->cur) {
-		switch (lexer->ptr[lexer->cur]) {
-			case ' ': case '\t': case '\n': case '\r':
-				// get next token
-				lexer->cur ++;
-				goto END;
-			default:
-				if (len == token_len) {
-					_D(CRIT, "not support token size > %zd", token_len);
-					return -1;
-				}
-
-				token[len++] = lexer->ptr[lexer->cur];
-				break;
-		}
+	/* scan the whole token span at once and copy in a single shot */
+	start = lexer->cur;
+	while (lexer->cur < lexer->size && !SEPARATOR[(unsigned char)lexer->ptr[lexer->cur]]) {
+		lexer->cur ++;
 	}
 
-END:
+	len = lexer->cur - start;
+	if (len >= token_len) {
+		_D(CRIT, "not support token size > %zd", token_len);
+		return -1;
+	}
+
+	memcpy(token, lexer->ptr + start, len);
 	token[len] = '\0';
 	return len;
 }